@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Template cache - memoized template reads for bootstrap handlers
+"""
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=128)
+def _load_template(path_str: str, mtime_ns: int) -> str:
+    """Return template contents, keyed by path and mtime so edits invalidate the entry."""
+    return Path(path_str).read_text()
+
+
+def load_template(template_path: Path) -> str:
+    """Read a template file, reusing the cached contents while it is unchanged."""
+    return _load_template(str(template_path), template_path.stat().st_mtime_ns)
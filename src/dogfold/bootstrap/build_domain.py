@@ -1,10 +1,56 @@
 #!/usr/bin/env python3
 """BuildDomain bootstrap utility - create domains from package templates."""
+import os
 import shutil
+import sys
 from pathlib import Path
 
 from dogfold.kernel.target_resolver import TargetResolver
 
+_HAS_SENDFILE = hasattr(os, "sendfile")
+
+
+def _sendfile(out_fd: int, in_fd: int, size: int) -> bool:
+    """Copy size bytes kernel-side; False if sendfile can't be used for these fds."""
+    if not _HAS_SENDFILE:
+        return False
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        if offset == 0:
+            return False
+        raise
+    return True
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """Copy src to dst, keeping timestamps (and exec bits) from a single fstat.
+
+    Unlike shutil.copy2 this skips copystat's xattr/flags syscalls; templates
+    only need mtime preserved.
+    """
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        st = os.fstat(src_fd)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            if st.st_mode & 0o111:
+                os.fchmod(dst_fd, st.st_mode & 0o777)
+            if not _sendfile(dst_fd, src_fd, st.st_size):
+                with open(src_fd, "rb", closefd=False) as fsrc, open(dst_fd, "wb", closefd=False) as fdst:
+                    shutil.copyfileobj(fsrc, fdst)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
 
 class BuildDomain:
     """Bootstrap utility to build domains from templates"""
@@ -22,6 +68,7 @@ class BuildDomain:
         Returns:
             int: 0 for success, 1 for error
         """
+        log_lines: list[str] = []
         try:
             target_key = target_package
             target_info = self.resolver.get_target_info(target_key)
@@ -45,42 +92,56 @@ class BuildDomain:
             # Ensure target domain directory exists
             domain_dir.mkdir(parents=True, exist_ok=True)
 
-            # Copy all template files recursively
+            # Copy all template files recursively (single os.walk pass). Target
+            # directories are only created, never stamped with template metadata.
             files_copied = 0
-            for item in templates_dir.rglob("*"):
-                if item.is_file():
-                    # Calculate relative path within templates
-                    rel_path = item.relative_to(templates_dir)
-
-                    # Handle special cases
-                    if rel_path.parts[0] == "schemas":
-                        # JSON schemas go to separate schemas directory
-                        schemas_target = target_root / "schemas" / domain_name
-                        schemas_target.mkdir(parents=True, exist_ok=True)
-                        schema_file = schemas_target / rel_path.name
-                        shutil.copy2(item, schema_file)
-                        print(f"📋 Schema: {rel_path} -> schemas/{domain_name}/{rel_path.name}")
-                    else:
-                        # Regular files go to domain structure
-                        target_file = domain_dir / rel_path
-
-                        # Ensure parent directories exist
-                        target_file.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(item, target_file)
-                        print(f"📋 File: {rel_path}")
-
+            domain_dir_str = os.fspath(domain_dir)
+            schemas_target = target_root / "schemas" / domain_name
+            schemas_target_str = os.fspath(schemas_target)
+            for dirpath, _, files in os.walk(templates_dir):
+                if not files:
+                    continue
+                rel_dir = os.path.relpath(dirpath, templates_dir)
+
+                # Handle special cases
+                if rel_dir.split(os.sep, 1)[0] == "schemas":
+                    # JSON schemas go to separate schemas directory (flattened)
+                    schemas_target.mkdir(parents=True, exist_ok=True)
+                    for fname in files:
+                        _copy_file(os.path.join(dirpath, fname), os.path.join(schemas_target_str, fname))
+                        files_copied += 1
+                        rel_path = os.path.join(rel_dir, fname)
+                        log_lines.append(f"📋 Schema: {rel_path} -> schemas/{domain_name}/{fname}\n")
+                    continue
+
+                # Regular files go to domain structure
+                if rel_dir == os.curdir:
+                    target_dir = domain_dir_str
+                    prefix = ""
+                else:
+                    target_dir = os.path.join(domain_dir_str, rel_dir)
+                    prefix = rel_dir + os.sep
+                    # Ensure parent directories exist
+                    os.makedirs(target_dir, exist_ok=True)
+                for fname in files:
+                    _copy_file(os.path.join(dirpath, fname), os.path.join(target_dir, fname))
                     files_copied += 1
+                    log_lines.append(f"📋 File: {prefix}{fname}\n")
 
             # Ensure __init__.py files exist where needed
             for subdir in ["classes", "verbs"]:
                 init_file = domain_dir / subdir / "__init__.py"
                 if not init_file.exists() and (domain_dir / subdir).exists():
                     init_file.touch()
-                    print(f"📋 Created: {subdir}/__init__.py")
+                    log_lines.append(f"📋 Created: {subdir}/__init__.py\n")
 
-            print(f"✅ Built domain '{domain_name}' in {target_info['package']}: {files_copied} files copied")
+            log_lines.append(f"✅ Built domain '{domain_name}' in {target_info['package']}: {files_copied} files copied\n")
+            # Emit the whole per-file log with a single write
+            sys.stdout.write("".join(log_lines))
             return 0
 
         except Exception as e:
+            # Keep the progress shown so far before reporting the failure
+            sys.stdout.write("".join(log_lines))
             print(f"❌ Error building domain '{domain_name}': {e}")
             return 1
\ No newline at end of file
@@ -6,6 +6,11 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from dogfold.bootstrap._template_cache import load_template
+
+_SNAKE_RE1 = re.compile(r"(.)([A-Z][a-z]+)")
+_SNAKE_RE2 = re.compile(r"([a-z0-9])([A-Z])")
+
 
 class DefineClass:
   """Handler for defining new classes"""
@@ -41,9 +46,9 @@ class DefineClass:
       else:
         inline_code = args[1]
 
-    # Get target package root
-    target_root = self.resolver.get_target_root(self.explicit_target)
-    target_info = self.resolver.get_target_info(self.explicit_target)
+    # Resolve the target once and read everything from it
+    target = self.resolver.resolve(self.explicit_target)
+    target_root = target.root
     
     snake = self._to_snake(class_name)
     if domain_name:
@@ -58,7 +63,7 @@ class DefineClass:
     if inline_code:
       content = inline_code
     else:
-      target_templates = self.resolver.get_templates_root(self.explicit_target)
+      target_templates = target.templates
       generic_template = target_templates / "class_template.py"
 
       if domain_name:
@@ -69,13 +74,11 @@ class DefineClass:
       template_path = specific_template if specific_template.exists() else generic_template
       if not template_path.exists():
         return f"❌ Template file not found: {template_path}"
-      content = template_path.read_text()
+      content = load_template(template_path)
       content = content.replace("{CLASS_NAME}", class_name)
 
     target_file.write_text(content if content.endswith("\n") else content + "\n")
-    return f"✅ Defined class '{class_name}' in {target_info['package']} -> {target_file}"
+    return f"✅ Defined class '{class_name}' in {target.package} -> {target_file}"
 
   def _to_snake(self, name: str) -> str:
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    s2 = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1)
-    return s2.lower()
+    return _SNAKE_RE2.sub(r"\1_\2", _SNAKE_RE1.sub(r"\1_\2", name)).lower()
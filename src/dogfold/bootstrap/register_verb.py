@@ -3,9 +3,15 @@
 RegisterVerb - Creates new verb files from templates
 """
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
+from dogfold.bootstrap._template_cache import load_template
+
+_PLACEHOLDER_RE = re.compile(r"\{VERB_NAME\}|VerbNameVerb")
+
+
 class RegisterVerb:
     """Handler for registering new verbs"""
     
@@ -43,9 +49,9 @@ class RegisterVerb:
                 return f"❌ Invalid domain.verb name: {full_name}"
             domain_name, verb_name = parts[0], parts[1]
 
-        # Get target package root
-        target_root = self.resolver.get_target_root(self.explicit_target)
-        target_info = self.resolver.get_target_info(self.explicit_target)
+        # Resolve the target once and read everything from it
+        target = self.resolver.resolve(self.explicit_target)
+        target_root = target.root
         
         # Ensure target directory exists
         if domain_name:
@@ -58,8 +64,7 @@ class RegisterVerb:
             init_file.write_text("")
 
         # Get target-specific template paths
-        target_info = self.resolver.get_target_info(self.explicit_target)
-        templates_root = self.resolver.get_templates_root(self.explicit_target)
+        templates_root = target.templates
 
         # Prefer verb-specific template (domain-aware) if present
         if domain_name:
@@ -75,13 +80,12 @@ class RegisterVerb:
         if not template_path.exists():
             return f"❌ Template file not found: {template_path}"
 
-        with open(template_path, "r") as f:
-            template_content = f.read()
+        template_content = load_template(template_path)
 
         # Inline injection not supported yet (ignored)
-        # Replace placeholders for class and verb name
-        verb_content = template_content.replace("{VERB_NAME}", verb_name)
-        verb_content = verb_content.replace("VerbNameVerb", f"{verb_name.title()}Verb")
+        # Replace placeholders for class and verb name in a single pass
+        replacements = {"{VERB_NAME}": verb_name, "VerbNameVerb": f"{verb_name.title()}Verb"}
+        verb_content = _PLACEHOLDER_RE.sub(lambda m: replacements[m.group(0)], template_content)
 
         # Write verb file (skip if exists)
         verb_file = target_dir / f"{verb_name}.py"
@@ -93,8 +97,8 @@ class RegisterVerb:
             f.write(verb_content)
 
         if domain_name:
-            return f"✅ Registered verb '{domain_name}.{verb_name}' in {target_info['package']} -> {verb_file}"
-        return f"✅ Registered verb '{verb_name}' in {target_info['package']} -> {verb_file}"
+            return f"✅ Registered verb '{domain_name}.{verb_name}' in {target.package} -> {verb_file}"
+        return f"✅ Registered verb '{verb_name}' in {target.package} -> {verb_file}"
 
     def _inject_inline_into_execute(self, content: str, indented_block: str) -> str:
         """Insert inline code as the body of execute, replacing the default body."""
@@ -1,52 +1,64 @@
 #!/usr/bin/env python3
 import os
 import sys
+import importlib
 import importlib.util
 from pathlib import Path
-import typer
 from typing import Optional
 import textwrap
 
-try:  # Optional legacy collision warning (if abandoned 'spec' distribution is present)
-    import importlib.metadata as _im
-    if any(d.metadata['Name'].lower() == 'spec' and d.metadata['Name'] != 'spec-core' for d in _im.distributions()):
-        import warnings as _warnings
-        _warnings.warn("Another distribution named 'spec' detected; 'spec-core' is supplying the 'spec' CLI.")
-except Exception:
-    pass
-app = typer.Typer(name="dog", help="Dogfold: Recursive meta-scaffolding for Python projects")
+def _check_legacy_distribution():
+    """Warn if an abandoned 'spec' distribution is installed alongside spec-core.
 
-# Dynamically load domain command groups
-def _load_domain_apps():
-    """Load domain command groups from dogfold.domains"""
-    domains_path = Path(__file__).parent / "domains"
-    if not domains_path.exists():
+    Walking every installed distribution is slow, so the check only runs when
+    the DOGFOLD_CHECK_LEGACY environment variable is set.
+    """
+    if not os.environ.get("DOGFOLD_CHECK_LEGACY"):
         return
-    
-    for domain_dir in domains_path.iterdir():
-        if not domain_dir.is_dir() or domain_dir.name.startswith('_'):
-            continue
-        
-        commands_file = domain_dir / "commands.py"
-        if commands_file.exists():
-            try:
-                # Import the domain's command app
-                module_name = f"dogfold.domains.{domain_dir.name}.commands"
-                module = importlib.util.spec_from_file_location(module_name, commands_file)
-                if module and module.loader:
-                    domain_module = importlib.util.module_from_spec(module)
-                    module.loader.exec_module(domain_module)
-                    
-                    # Look for the domain app (conventionally named {domain}_app)
-                    app_name = f"{domain_dir.name}_app"
-                    if hasattr(domain_module, app_name):
-                        domain_app = getattr(domain_module, app_name)
-                        app.add_typer(domain_app, name=domain_dir.name)
-            except Exception as e:
-                print(f"Warning: Could not load domain '{domain_dir.name}': {e}")
+    try:  # Optional legacy collision warning (if abandoned 'spec' distribution is present)
+        import importlib.metadata as _im
+        if any(d.metadata['Name'].lower() == 'spec' and d.metadata['Name'] != 'spec-core' for d in _im.distributions()):
+            import warnings as _warnings
+            _warnings.warn("Another distribution named 'spec' detected; 'spec-core' is supplying the 'spec' CLI.")
+    except Exception:
+        pass
+
+_check_legacy_distribution()
 
-# Load domains at startup
-_load_domain_apps()
+_DOMAINS_PATH = Path(__file__).parent / "domains"
+
+# Dynamically load domain command groups
+def _domain_names():
+    """List domain command groups under dogfold.domains without importing them"""
+    if not _DOMAINS_PATH.exists():
+        return []
+
+    return [
+        domain_dir.name
+        for domain_dir in _DOMAINS_PATH.iterdir()
+        if domain_dir.is_dir()
+        and not domain_dir.name.startswith('_')
+        and (domain_dir / "commands.py").exists()
+    ]
+
+
+def _load_domain_app(domain_name: str):
+    """Import one domain's commands.py and return its Typer app (or None)"""
+    commands_file = _DOMAINS_PATH / domain_name / "commands.py"
+    try:
+        # Import the domain's command app
+        module_name = f"dogfold.domains.{domain_name}.commands"
+        module = importlib.util.spec_from_file_location(module_name, commands_file)
+        if not module or not module.loader:
+            return None
+        domain_module = importlib.util.module_from_spec(module)
+        module.loader.exec_module(domain_module)
+
+        # Look for the domain app (conventionally named {domain}_app)
+        return getattr(domain_module, f"{domain_name}_app", None)
+    except Exception as e:
+        print(f"Warning: Could not load domain '{domain_name}': {e}")
+    return None
 
 
 def main():
@@ -57,6 +69,7 @@ def main():
         if stdin_code:
             return _exec_code(stdin_code)
 
+    app = _get_app()
     try:
         app()
     except SystemExit as e:
@@ -67,34 +80,35 @@ def main():
 class SpecCLI:
     def __init__(self):
         # No more sys.path manipulation - use clean package imports
-        pass
+        self._verbs_cache: dict | None = None
 
     def _load_verbs(self):
+        if self._verbs_cache is not None:
+            return self._verbs_cache
         verbs = {}
         # Load verbs from dogfold.verbs package
         try:
             from dogfold import verbs as verbs_package
             verbs_dir = Path(verbs_package.__file__).parent
             if verbs_dir.exists():
-                for verb_file in verbs_dir.glob("*.py"):
-                    if verb_file.name == "__init__.py":
+                for entry in os.scandir(verbs_dir):
+                    name = entry.name
+                    if not name.endswith(".py") or name == "__init__.py":
                         continue
-                    verb_name = verb_file.stem
-                    handler = self._load_handler(verb_file, f"{verb_name.title()}SpecVerb")
+                    verb_name = name[:-3]
+                    handler = self._load_handler(verb_name, f"{verb_name.title()}SpecVerb")
                     if handler:
                         verbs[verb_name] = handler
         except ImportError:
             # verbs package doesn't exist yet, that's fine
             pass
+        self._verbs_cache = verbs
         return verbs
 
-    def _load_handler(self, verb_file: Path, class_name: str):
+    def _load_handler(self, verb_name: str, class_name: str):
         try:
-            spec = importlib.util.spec_from_file_location(verb_file.stem, verb_file)
-            if spec is None or spec.loader is None:
-                return None
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # import_module reuses sys.modules on repeat loads
+            module = importlib.import_module(f"dogfold.verbs.{verb_name}")
             if hasattr(module, class_name):
                 cls = getattr(module, class_name)
                 # Handle classes that need constructor arguments
@@ -103,7 +117,7 @@ class SpecCLI:
                 else:
                     return cls()
         except Exception as e:
-            print(f"Warning: Could not load dogfold verb '{verb_file}': {e}")
+            print(f"Warning: Could not load dogfold verb '{verb_name}': {e}")
         return None
 
     def run_verb(self, verb_name: str, args: list[str]) -> int:
@@ -120,7 +134,7 @@ class SpecCLI:
     def exec_code(self, code: str) -> int:
         """Execute Python code"""
         try:
-            exec(code, globals())
+            exec(code, _get_exec_namespace())
             return 0
         except Exception as e:
             print(f"Error: {e}")
@@ -135,134 +149,219 @@ class SpecCLI:
             return 1
 
 
+_spec_cli_singleton: SpecCLI | None = None
+
+
+def _get_cli() -> SpecCLI:
+    """Return the process-wide SpecCLI so loaded verbs are reused across commands"""
+    global _spec_cli_singleton
+    if _spec_cli_singleton is None:
+        _spec_cli_singleton = SpecCLI()
+    return _spec_cli_singleton
+
+
+class _ExecNamespace(dict):
+    """Globals for executed code: this module's namespace, with `typer` and `app` loaded on first use"""
+
+    def __missing__(self, key):
+        if key not in ("typer", "app"):
+            raise KeyError(key)
+        value = __getattr__(key)
+        self[key] = value
+        return value
+
+
+_exec_namespace: _ExecNamespace | None = None
+
+
+def _get_exec_namespace() -> _ExecNamespace:
+    """Return the process-wide exec namespace so state persists between executions"""
+    global _exec_namespace
+    if _exec_namespace is None:
+        _exec_namespace = _ExecNamespace(globals())
+    return _exec_namespace
+
+
 def _exec_code(code: str) -> int:
     """Execute Python code (module-level function)"""
-    cli = SpecCLI()
-    return cli.exec_code(code)
-
-
-# Create register subapp with proper subcommands
-register_app = typer.Typer(help="Register resources")
-
-@register_app.command("domain")
-def register_domain(
-    name: str = typer.Argument(..., help="Domain name"),
-    target: str = typer.Option(None, "--target", help="Target package (dogfold, life-cli)"),
-    self_target: bool = typer.Option(False, "--self", help="Target dogfold package")
-):
-    """Register a new domain"""
-    # Build args list for the verb
-    args = ["domain", name]
-    if target:
-        args.extend(["--target", target])
-    if self_target:
-        args.append("--self")
-    
-    cli = SpecCLI()
-    result = cli.run_verb("register", args)
-    if result != 0:
-        raise typer.Exit(result)
-
-@register_app.command("verb")
-def register_verb(
-    name: str = typer.Argument(..., help="Verb name (can include domain.verb)"),
-    target: str = typer.Option(None, "--target", help="Target package (dogfold, life-cli)"),
-    self_target: bool = typer.Option(False, "--self", help="Target dogfold package"),
-    inline_code: str = typer.Option(None, "--code", help="Inline code for verb")
-):
-    """Register a new verb"""
-    # Build args list for the verb
-    args = ["verb", name]
-    if target:
-        args.extend(["--target", target])
-    if self_target:
-        args.append("--self")
-    if inline_code:
-        args.append(inline_code)
-    
-    cli = SpecCLI()
-    result = cli.run_verb("register", args)
-    if result != 0:
-        raise typer.Exit(result)
-
-@register_app.command("cli")
-def register_cli(
-    name: str = typer.Argument(..., help="CLI name"),
-    target: str = typer.Option(None, "--target", help="Target package (dogfold, life-cli)"),
-    self_target: bool = typer.Option(False, "--self", help="Target dogfold package")
-):
-    """Register a new CLI"""
-    # Build args list for the verb
-    args = ["cli", name]
-    if target:
-        args.extend(["--target", target])
-    if self_target:
-        args.append("--self")
-    
-    cli = SpecCLI()
-    result = cli.run_verb("register", args)
-    if result != 0:
-        raise typer.Exit(result)
-
-# Add the register subapp to main app
-app.add_typer(register_app, name="register")
-
-
-@app.command("define", context_settings={"allow_extra_args": True, "allow_interspersed_args": False})
-def define_cmd(
-    ctx: typer.Context,
-    define_type: str = typer.Argument(help="Type to define (contract, class)")
-):
-    """Define a new component or structure"""
-    # Pass all arguments directly to the define verb
-    args = [define_type] + ctx.args
-
-    cli = SpecCLI()
-    result = cli.run_verb("define", args)
-    if result != 0:
-        raise typer.Exit(result)
-
-
-@app.command(context_settings={"allow_extra_args": True, "allow_interspersed_args": False})
-def execute(
-    ctx: typer.Context,
-    code: str = typer.Argument(help="Python code to execute")
-):
-    """Execute Python code directly"""
-    # Handle case where code and extra args should be joined
-    full_code = code
-    if ctx.args:
-        full_code = " ".join([code] + ctx.args)
-    
-    result = _exec_code(full_code)
-    if result != 0:
-        raise typer.Exit(result)
-
-
-@app.callback()
-def main_callback(ctx: typer.Context):
-    """Dogfold: Recursive meta-scaffolding for Python projects"""
-    # This callback only handles setup - no argument processing
-    # Arguments are handled by individual commands
-    pass
-
-
-# -----------------------------
-# Scaffolding (dog init)
-# -----------------------------
-
-@app.command("init")
-def init_command(
-    name: str = typer.Argument(..., help="New tool / package name (kebab or snake)"),
-    force: bool = typer.Option(False, "--force", help="Overwrite existing files if present"),
-):
-    """Scaffold a minimal dogfold-powered CLI project."""
-    root = Path(name)
-    pkg = name.replace('-', '_')
-    src_pkg = root / "src" / pkg
-    files = {
-        root / "README.md": f"# {name}\n\nGenerated with dogfold.\n",
-        root / "pyproject.toml": textwrap.dedent(f"""
+    return _get_cli().exec_code(code)
+
+
+_app = None
+
+
+def _get_app():
+    """Return the Typer app, building it on first use"""
+    global _app
+    if _app is None:
+        _app = _build_app()
+    return _app
+
+
+def __getattr__(name):
+    # `app` and `typer` used to be module globals; keep them importable lazily
+    if name == "app":
+        return _get_app()
+    if name == "typer":
+        import typer
+        return typer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _build_app():
+    """Build the Typer app; typer is only imported once we know we need it"""
+    import typer
+    from typer.core import TyperGroup
+
+    class _LazyDomainGroup(TyperGroup):
+        """Root command group that imports a domain's commands only when it is dispatched
+
+        `dog --help` still imports every domain: the help formatter calls
+        get_command for each listed name to read its help text.
+        """
+
+        _domain_names_cache: list[str] | None = None
+
+        def _domains(self):
+            if self._domain_names_cache is None:
+                self._domain_names_cache = _domain_names()
+            return self._domain_names_cache
+
+        def list_commands(self, ctx):
+            commands = super().list_commands(ctx)
+            return commands + [name for name in self._domains() if name not in self.commands]
+
+        def get_command(self, ctx, cmd_name):
+            command = super().get_command(ctx, cmd_name)
+            if command is None and cmd_name in self._domains():
+                domain_app = _load_domain_app(cmd_name)
+                if domain_app is not None:
+                    command = typer.main.get_group(domain_app)
+                    # get_group leaves name unset; help output reads command.name
+                    command.name = cmd_name
+                    self.add_command(command, cmd_name)
+            return command
+
+    app = typer.Typer(
+        name="dog",
+        help="Dogfold: Recursive meta-scaffolding for Python projects",
+        cls=_LazyDomainGroup,
+    )
+
+    # Create register subapp with proper subcommands
+    register_app = typer.Typer(help="Register resources")
+
+    @register_app.command("domain")
+    def register_domain(
+        name: str = typer.Argument(..., help="Domain name"),
+        target: str = typer.Option(None, "--target", help="Target package (dogfold, life-cli)"),
+        self_target: bool = typer.Option(False, "--self", help="Target dogfold package")
+    ):
+        """Register a new domain"""
+        # Build args list for the verb
+        args = ["domain", name]
+        if target:
+            args.extend(["--target", target])
+        if self_target:
+            args.append("--self")
+
+        result = _get_cli().run_verb("register", args)
+        if result != 0:
+            raise typer.Exit(result)
+
+    @register_app.command("verb")
+    def register_verb(
+        name: str = typer.Argument(..., help="Verb name (can include domain.verb)"),
+        target: str = typer.Option(None, "--target", help="Target package (dogfold, life-cli)"),
+        self_target: bool = typer.Option(False, "--self", help="Target dogfold package"),
+        inline_code: str = typer.Option(None, "--code", help="Inline code for verb")
+    ):
+        """Register a new verb"""
+        # Build args list for the verb
+        args = ["verb", name]
+        if target:
+            args.extend(["--target", target])
+        if self_target:
+            args.append("--self")
+        if inline_code:
+            args.append(inline_code)
+
+        result = _get_cli().run_verb("register", args)
+        if result != 0:
+            raise typer.Exit(result)
+
+    @register_app.command("cli")
+    def register_cli(
+        name: str = typer.Argument(..., help="CLI name"),
+        target: str = typer.Option(None, "--target", help="Target package (dogfold, life-cli)"),
+        self_target: bool = typer.Option(False, "--self", help="Target dogfold package")
+    ):
+        """Register a new CLI"""
+        # Build args list for the verb
+        args = ["cli", name]
+        if target:
+            args.extend(["--target", target])
+        if self_target:
+            args.append("--self")
+
+        result = _get_cli().run_verb("register", args)
+        if result != 0:
+            raise typer.Exit(result)
+
+    # Add the register subapp to main app
+    app.add_typer(register_app, name="register")
+
+    @app.command("define", context_settings={"allow_extra_args": True, "allow_interspersed_args": False})
+    def define_cmd(
+        ctx: typer.Context,
+        define_type: str = typer.Argument(help="Type to define (contract, class)")
+    ):
+        """Define a new component or structure"""
+        # Pass all arguments directly to the define verb
+        args = [define_type] + ctx.args
+
+        result = _get_cli().run_verb("define", args)
+        if result != 0:
+            raise typer.Exit(result)
+
+    @app.command(context_settings={"allow_extra_args": True, "allow_interspersed_args": False})
+    def execute(
+        ctx: typer.Context,
+        code: str = typer.Argument(help="Python code to execute")
+    ):
+        """Execute Python code directly"""
+        # Handle case where code and extra args should be joined
+        full_code = code
+        if ctx.args:
+            full_code = " ".join([code] + ctx.args)
+
+        result = _exec_code(full_code)
+        if result != 0:
+            raise typer.Exit(result)
+
+    @app.callback()
+    def main_callback(ctx: typer.Context):
+        """Dogfold: Recursive meta-scaffolding for Python projects"""
+        # This callback only handles setup - no argument processing
+        # Arguments are handled by individual commands
+        pass
+
+    # -----------------------------
+    # Scaffolding (dog init)
+    # -----------------------------
+
+    @app.command("init")
+    def init_command(
+        name: str = typer.Argument(..., help="New tool / package name (kebab or snake)"),
+        force: bool = typer.Option(False, "--force", help="Overwrite existing files if present"),
+    ):
+        """Scaffold a minimal dogfold-powered CLI project."""
+        root = Path(name)
+        pkg = name.replace('-', '_')
+        src_pkg = root / "src" / pkg
+        files = {
+            root / "README.md": f"# {name}\n\nGenerated with dogfold.\n",
+            root / "pyproject.toml": textwrap.dedent(f"""
 [build-system]
 requires = ["setuptools>=61.0", "wheel"]
 build-backend = "setuptools.build_meta"
@@ -283,15 +382,15 @@ dependencies = ["dogfold>=0.1.0,<0.2.0", "typer>=0.12.0"]
 where = ["src"]
 include = ["{pkg}*"]
 """),
-        root / "Makefile": textwrap.dedent("""
+            root / "Makefile": textwrap.dedent("""
 dev: ## install editable
 	pip install -e .
 
 build: ## placeholder build/regeneration hook
 	@echo "(Add dog build verbs when implemented)"
 """),
-        src_pkg / "__init__.py": f"# {pkg} package\n",
-        src_pkg / "cli.py": textwrap.dedent(f"""
+            src_pkg / "__init__.py": f"# {pkg} package\n",
+            src_pkg / "cli.py": textwrap.dedent(f"""
 import typer
 app = typer.Typer(help=\"{name} CLI\")
 
@@ -306,30 +405,32 @@ def main():
 if __name__ == '__main__':
     main()
 """),
-    }
-
-    # Create directories
-    if not src_pkg.exists():
-        src_pkg.mkdir(parents=True, exist_ok=True)
-
-    created = []
-    skipped = []
-    for path, content in files.items():
-        if path.exists() and not force:
-            skipped.append(path)
-            continue
-        path.write_text(content)
-        created.append(path)
-
-    if created:
-        typer.echo("Created:")
-        for p in created:
-            typer.echo(f"  - {p}")
-    if skipped:
-        typer.echo("Skipped (exists, use --force to overwrite):")
-        for p in skipped:
-            typer.echo(f"  - {p}")
-    typer.echo("Done.")
+        }
+
+        # Create directories
+        if not src_pkg.exists():
+            src_pkg.mkdir(parents=True, exist_ok=True)
+
+        created = []
+        skipped = []
+        for path, content in files.items():
+            if path.exists() and not force:
+                skipped.append(path)
+                continue
+            path.write_text(content)
+            created.append(path)
+
+        if created:
+            typer.echo("Created:")
+            for p in created:
+                typer.echo(f"  - {p}")
+        if skipped:
+            typer.echo("Skipped (exists, use --force to overwrite):")
+            for p in skipped:
+                typer.echo(f"  - {p}")
+        typer.echo("Done.")
+
+    return app
 
 
 if __name__ == "__main__":
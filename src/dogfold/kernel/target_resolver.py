@@ -1,10 +1,24 @@
 """Target resolution utilities for spec-core scaffolding verbs."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Iterable, List, Optional, Tuple
 
+# Resolved once at import; realpath is a syscall we don't want per resolver
+_CURRENT_FILE = Path(__file__).resolve()
+_DEFAULT_REPO_ROOT = _CURRENT_FILE.parents[3]
+_DEFAULT_PACKAGE_ROOT = _CURRENT_FILE.parents[1]
+
+_ALIASES = MappingProxyType({
+    "spec": "spec-core",
+    "spec-dev": "spec-core",
+    "spec_core": "spec-core",
+    "spec-core": "spec-core",
+})
+
 
 @dataclass(frozen=True)
 class Target:
@@ -16,35 +30,41 @@ class Target:
     templates: Path
     repo_root: Path
     project_root: Path
+    _info: Dict[str, object] = field(init=False, repr=False, compare=False)
 
-    def to_dict(self) -> Dict[str, object]:
-        return {
+    def __post_init__(self) -> None:
+        # Fields never change after construction, so build the dict view once
+        object.__setattr__(self, "_info", {
             "key": self.key,
             "package": self.package,
             "root": self.root,
             "templates": self.templates,
             "repo_root": self.repo_root,
             "project_root": self.project_root,
-        }
+        })
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the target as a dict (shared between calls; treat as read-only)."""
+        return self._info
 
 
 class TargetResolver:
     """Locate package roots and template directories for scaffolding verbs."""
 
+    _aliases = _ALIASES
+
     def __init__(self, repo_root: Optional[Path] = None, package_root: Optional[Path] = None):
-        current_file = Path(__file__).resolve()
-        self.repo_root = Path(repo_root).resolve() if repo_root else current_file.parents[3]
-        self.package_root = Path(package_root).resolve() if package_root else current_file.parents[1]
-        self.package_templates = self.package_root / "templates"
-
-        self._targets: Dict[str, Target] = self._discover_targets()
-        self._aliases: Dict[str, str] = {
-            "spec": "spec-core",
-            "spec-dev": "spec-core",
-            "spec_core": "spec-core",
-            "spec-core": "spec-core",
-        }
+        self.repo_root = Path(repo_root).resolve() if repo_root else _DEFAULT_REPO_ROOT
+        self.package_root = Path(package_root).resolve() if package_root else _DEFAULT_PACKAGE_ROOT
+
         self.default_target = "spec-core"
+        # Per-instance memo; wrapping the bound method keeps the cache off the class
+        self._resolve_target = lru_cache(maxsize=16)(self._resolve_target_impl)
+
+    @cached_property
+    def package_templates(self) -> Path:
+        """Template directory bundled with the dogfold package."""
+        return self.package_root / "templates"
 
     # ------------------------------------------------------------------
     # Public API
@@ -53,6 +73,9 @@ class TargetResolver:
         """Extract the target selector from a verb argument list."""
 
         args = list(args)
+        if "--target" not in args and "--self" not in args:
+            # Common case: no selector, nothing to strip
+            return None, args
         target: Optional[str] = None
         remaining: List[str] = []
         i = 0
@@ -70,6 +93,10 @@ class TargetResolver:
             i += 1
         return target, remaining
 
+    def resolve(self, target: Optional[str] = None) -> Target:
+        """Return the resolved Target so callers can read several fields in one lookup."""
+        return self._resolve_target(target)
+
     def get_target_root(self, target: Optional[str] = None) -> Path:
         """Return the filesystem root for the selected target package."""
         return self._resolve_target(target).root
@@ -79,7 +106,7 @@ class TargetResolver:
         return self._resolve_target(target).templates
 
     def get_target_info(self, target: Optional[str] = None) -> Dict[str, object]:
-        """Return metadata describing the desired target."""
+        """Return metadata describing the desired target (shared; do not mutate)."""
         return self._resolve_target(target).to_dict()
 
     def get_project_root(self, target: Optional[str] = None) -> Path:
@@ -93,7 +120,12 @@ class TargetResolver:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _resolve_target(self, target: Optional[str]) -> Target:
+    @cached_property
+    def _targets(self) -> Dict[str, Target]:
+        # Discovery touches the filesystem, so defer it until a lookup needs it
+        return self._discover_targets()
+
+    def _resolve_target_impl(self, target: Optional[str]) -> Target:
         key = self._normalise_key(target)
         try:
             return self._targets[key]
@@ -155,3 +187,9 @@ class TargetResolver:
             if candidate.is_dir() and not candidate.name.startswith("__"):
                 return candidate
         return None
+
+
+@lru_cache(maxsize=None)
+def default_resolver() -> TargetResolver:
+    """Return the process-wide resolver for the installed package layout."""
+    return TargetResolver()
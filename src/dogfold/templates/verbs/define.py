@@ -7,6 +7,7 @@ from pathlib import Path
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_PROJECT_ROOT_STR = str(PROJECT_ROOT)
 
 
 class DefineSpecVerb:
@@ -20,7 +21,8 @@ class DefineSpecVerb:
       if not args:
         print("Usage: spec define class <ClassName> [--domain <name>] [<inline>]")
         return 1
-    sys.path.insert(0, str(PROJECT_ROOT))
+    if _PROJECT_ROOT_STR not in sys.path:
+      sys.path.insert(0, _PROJECT_ROOT_STR)
     try:
       from src.define_class import DefineClass
       handler = DefineClass()
@@ -7,6 +7,15 @@ from pathlib import Path
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_PROJECT_ROOT_STR = str(PROJECT_ROOT)
+
+
+def _touch_new(path: Path) -> None:
+  """Create an empty file unless it exists (one open, no separate stat)."""
+  try:
+    path.open('x').close()
+  except FileExistsError:
+    pass
 
 
 class RegisterSpecVerb:
@@ -34,11 +43,11 @@ class RegisterSpecVerb:
     domain_root = PROJECT_ROOT / "src" / "domains" / name
     classes_dir = domain_root / "classes"
     verbs_dir = domain_root / "verbs"
-    classes_dir.mkdir(parents=True, exist_ok=True)
-    verbs_dir.mkdir(parents=True, exist_ok=True)
-    (domain_root / "__init__.py").write_text("") if not (domain_root / "__init__.py").exists() else None
-    (classes_dir / "__init__.py").write_text("") if not (classes_dir / "__init__.py").exists() else None
-    (verbs_dir / "__init__.py").write_text("") if not (verbs_dir / "__init__.py").exists() else None
+    domain_root.mkdir(parents=True, exist_ok=True)
+    classes_dir.mkdir(exist_ok=True)
+    verbs_dir.mkdir(exist_ok=True)
+    for package_dir in (domain_root, classes_dir, verbs_dir):
+      _touch_new(package_dir / "__init__.py")
     print(f"✅ Registered domain '{name}' -> {domain_root}")
     return 0
 
@@ -55,7 +64,8 @@ class RegisterSpecVerb:
     if not args:
       print("Usage: spec register verb <name>|<domain.verb> [<inline code>]")
       return 1
-    sys.path.insert(0, str(PROJECT_ROOT))
+    if _PROJECT_ROOT_STR not in sys.path:
+      sys.path.insert(0, _PROJECT_ROOT_STR)
     try:
       from src.register_verb import RegisterVerb
       handler = RegisterVerb()
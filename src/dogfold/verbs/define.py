@@ -2,151 +2,63 @@
 """
 DefineSpecVerb - Define new classes with registries
 """
-import json
-import yaml
+import functools
+import py_compile
+import re
+import shutil
+import sys
 from pathlib import Path
 from datetime import datetime
-from dogfold.kernel.target_resolver import TargetResolver
+from dogfold.kernel.target_resolver import default_resolver
 
+_SNAKE_RE1 = re.compile(r'(.)([A-Z][a-z]+)')
+_SNAKE_RE2 = re.compile(r'([a-z0-9])([A-Z])')
 
-class DefineSpecVerb:
-    """Define classes of any name with their registries"""
-
-    def __init__(self):
-        self.resolver = TargetResolver()
-
-    def execute(self, args):
-        """Execute define command
-
-        Usage:
-            spec define <ClassName> [--target <package>] [--self] [--version x.y.z] [--reverse]
-        """
-        if not args:
-            print("Usage: spec define <ClassName> [--target <package>] [--self] [--version x.y.z] [--reverse]")
-            return 1
-
-        class_name = args[0]
-
-        # Parse arguments
-        target, version, reverse = self._parse_args(args[1:])
-
-        try:
-            # Resolve target paths
-            target_info = self.resolver.get_target_info(target)
-            target_root = target_info['root']
-
-            # Convert ClassName to snake_case for directory
-            dir_name = self._to_snake_case(class_name)
-            class_dir = target_root / dir_name
-
-            # Handle reverse operation
-            if reverse:
-                return self._reverse_class(class_dir, class_name, target_info)
-
-            # Create class directory and files
-            return self._create_class(class_dir, class_name, version, target_info)
-
-        except Exception as e:
-            print(f"❌ Error defining class: {str(e)}")
-            return 1
+# define flags: flag -> (option key, fixed value or None when it takes the next token)
+_DEFINE_FLAGS = {
+    '--target': ('target', None),
+    '--self': ('target', 'spec-core'),
+    '--version': ('version', None),
+    '--reverse': ('reverse', True),
+}
 
-    def _parse_args(self, args):
-        """Parse arguments"""
-        target = None
-        version = "1.0.0"
-        reverse = False
-
-        i = 0
-        while i < len(args):
-            if args[i] == '--target' and i + 1 < len(args):
-                target = args[i + 1]
-                i += 2
-            elif args[i] == '--self':
-                target = 'spec-core'
-                i += 1
-            elif args[i] == '--version' and i + 1 < len(args):
-                version = args[i + 1]
-                i += 2
-            elif args[i] == '--reverse':
-                reverse = True
-                i += 1
-            else:
-                i += 1
-
-        return target, version, reverse
-
-    def _reverse_class(self, class_dir, class_name, target_info):
-        """Remove class directory and all files"""
-        try:
-            if not class_dir.exists():
-                print(f"⚠️  Class directory does not exist: {class_dir}")
-                return 0
-
-            # Remove the entire class directory
-            import shutil
-            shutil.rmtree(class_dir)
-
-            print(f"✅ Removed {class_name} from {target_info['package']} -> {class_dir}")
-            return 0
-
-        except Exception as e:
-            print(f"❌ Error removing class: {str(e)}")
-            return 1
-
-    def _create_class(self, class_dir, class_name, version, target_info):
-        """Create class directory and files"""
-        try:
-            # Create class directory
-            class_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create __init__.py
-            init_file = class_dir / "__init__.py"
-            if not init_file.exists():
-                init_file.write_text(f"# {class_name} module")
-
-            # Create class file
-            class_result = self._create_class_file(class_dir, class_name, version)
-            if class_result != 0:
-                return class_result
-
-            # Create registry file
-            registry_result = self._create_registry_file(class_dir, class_name, version, target_info)
-            if registry_result != 0:
-                return registry_result
-
-            print(f"✅ Defined {class_name} in {target_info['package']} -> {class_dir}")
-            print(f"📁 Created: {self._to_snake_case(class_name)}_class.py, {self._to_snake_case(class_name)}_registry.yml")
-            print(f"🔢 Version: {version}")
-
-            return 0
-
-        except Exception as e:
-            print(f"❌ Error creating class: {str(e)}")
-            return 1
-
-    def _create_class_file(self, class_dir, class_name, version):
-        """Create the class file"""
-        try:
-            snake_name = self._to_snake_case(class_name)
-            created_at = datetime.now().isoformat()
-
-            class_content = f'''#!/usr/bin/env python3
+# Source for generated <snake>_class.py files; ${name} marks a substitution slot
+_CLASS_TEMPLATE = '''#!/usr/bin/env python3
 """
-{class_name} class and registry
+${class_name} class and registry
 """
-import yaml
+import textwrap
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
 
+_yaml = None
+_Dumper = None
+
+# Attributes to_dict() emits explicitly rather than from __dict__
+_RESERVED = frozenset(("name", "version", "created_at", "updated_at"))
+
+# yaml's default line width, less the 2 columns items are indented by under 'items:'
+_ITEM_WIDTH = 80 - 2
+
+
+def _get_yaml():
+    """Import yaml on first save/load, preferring the libyaml safe dumper"""
+    global _yaml, _Dumper
+    if _yaml is None:
+        import yaml
+        _Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        _yaml = yaml
+    return _yaml
+
 
-class {class_name}:
-    """Individual {class_name.lower()} definition"""
+class ${class_name}:
+    """Individual ${class_name_lower} definition"""
 
     def __init__(self, name: str, **kwargs):
         self.name = name
-        self.version = "{version}"
-        self.created_at = datetime.fromisoformat("{created_at}")
+        self.version = "${version}"
+        self.created_at = datetime.fromisoformat("${created_at}")
         self.updated_at = self.created_at
 
         # Store additional attributes
@@ -155,16 +67,16 @@ class {class_name}:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        result = {{
+        result = {
             "name": self.name,
             "version": self.version,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat()
-        }}
+        }
 
         # Add dynamic attributes
         for key, value in self.__dict__.items():
-            if key not in ["name", "version", "created_at", "updated_at"]:
+            if key not in _RESERVED:
                 if isinstance(value, datetime):
                     result[key] = value.isoformat()
                 else:
@@ -173,7 +85,7 @@ class {class_name}:
         return result
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> '{class_name}':
+    def from_dict(cls, data: Dict[str, Any]) -> '${class_name}':
         """Create from dictionary"""
         name = data.pop("name")
         version = data.pop("version", "1.0.0")
@@ -191,25 +103,25 @@ class {class_name}:
         return instance
 
 
-class {class_name}Registry:
-    """Registry holding {class_name} instances"""
+class ${class_name}Registry:
+    """Registry holding ${class_name} instances"""
 
     def __init__(self, storage_path: str = None):
-        self.items = {{}}
-        self.storage_path = storage_path or "{snake_name}_registry.yml"
-        self.version = "{version}"
-        self.created_at = datetime.fromisoformat("{created_at}")
+        self.items = {}
+        self.storage_path = storage_path or "${snake_name}_registry.yml"
+        self.version = "${version}"
+        self.created_at = datetime.fromisoformat("${created_at}")
 
-    def add(self, item: {class_name}) -> bool:
+    def add(self, item: ${class_name}) -> bool:
         """Add an item to the registry"""
         if item.name in self.items:
-            print(f"⚠️  {{item.name}} already exists in registry")
+            print(f"⚠️  {item.name} already exists in registry")
             return False
 
         self.items[item.name] = item
         return True
 
-    def get(self, name: str) -> {class_name}:
+    def get(self, name: str) -> ${class_name}:
         """Get an item by name"""
         return self.items.get(name)
 
@@ -226,19 +138,32 @@ class {class_name}Registry:
 
     def save(self):
         """Save registry to YAML file"""
-        registry_data = {{
+        header = {
             "registry_version": self.version,
-            "registry_type": "{class_name.lower()}",
+            "registry_type": "${class_name_lower}",
             "created_at": self.created_at.isoformat(),
             "updated_at": datetime.now().isoformat(),
-            "items": {{name: item.to_dict() for name, item in self.items.items()}}
-        }}
+        }
 
+        yaml = _get_yaml()
         with open(self.storage_path, 'w') as f:
-            yaml.dump(registry_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(header, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+            if not self.items:
+                f.write("items: {}\\n")
+                return
+
+            # Stream items one at a time instead of materialising the whole mapping.
+            # Each item is dumped at column 0 and shifted right by 2, so narrow the
+            # line width to match where a single dump would wrap long scalars.
+            f.write("items:\\n")
+            for name, item in self.items.items():
+                chunk = yaml.dump({name: item.to_dict()}, Dumper=_Dumper, default_flow_style=False,
+                                  sort_keys=False, width=_ITEM_WIDTH)
+                f.write(textwrap.indent(chunk, "  "))
 
     def load(self):
         """Load registry from YAML file"""
+        yaml = _get_yaml()
         try:
             with open(self.storage_path) as f:
                 data = yaml.safe_load(f)
@@ -247,8 +172,8 @@ class {class_name}Registry:
             if "created_at" in data:
                 self.created_at = datetime.fromisoformat(data["created_at"])
 
-            for name, item_data in data.get("items", {{}}).items():
-                item = {class_name}.from_dict(item_data)
+            for name, item_data in data.get("items", {}).items():
+                item = ${class_name}.from_dict(item_data)
                 self.items[name] = item
 
         except FileNotFoundError:
@@ -256,9 +181,147 @@ class {class_name}Registry:
             pass
 '''
 
+# Split once at import: even entries are literal text, odd entries are slot names
+_CLASS_TMPL_PARTS = re.split(r'\$\{(\w+)\}', _CLASS_TEMPLATE)
+
+
+class DefineSpecVerb:
+    """Define classes of any name with their registries"""
+
+    def __init__(self):
+        self.resolver = default_resolver()
+
+    def execute(self, args):
+        """Execute define command
+
+        Usage:
+            spec define <ClassName> [--target <package>] [--self] [--version x.y.z] [--reverse]
+        """
+        if not args:
+            print("Usage: spec define <ClassName> [--target <package>] [--self] [--version x.y.z] [--reverse]")
+            return 1
+
+        class_name = args[0]
+
+        # Parse arguments
+        target, version, reverse = self._parse_args(args[1:])
+
+        try:
+            # Resolve target paths
+            target_info = self.resolver.get_target_info(target)
+            target_root = target_info['root']
+
+            # Convert ClassName to snake_case for directory
+            snake_name = self._to_snake_case(class_name)
+            class_dir = target_root / snake_name
+
+            # Handle reverse operation
+            if reverse:
+                return self._reverse_class(class_dir, class_name, target_info)
+
+            # Create class directory and files, stamped with one shared timestamp
+            now_iso = datetime.now().isoformat()
+            return self._create_class(class_dir, class_name, snake_name, version, target_info, now_iso)
+
+        except Exception as e:
+            print(f"❌ Error defining class: {str(e)}")
+            return 1
+
+    def _parse_args(self, args):
+        """Parse arguments"""
+        opts = {"target": None, "version": "1.0.0", "reverse": False}
+
+        i = 0
+        n = len(args)
+        while i < n:
+            flag = _DEFINE_FLAGS.get(args[i])
+            if flag is None:
+                i += 1
+                continue
+            key, value = flag
+            if value is None:
+                # Flag takes the next token as its value (ignored if missing)
+                if i + 1 < n:
+                    opts[key] = args[i + 1]
+                    i += 2
+                    continue
+            else:
+                opts[key] = value
+            i += 1
+
+        return opts["target"], opts["version"], opts["reverse"]
+
+    def _reverse_class(self, class_dir, class_name, target_info):
+        """Remove class directory and all files"""
+        try:
+            if not class_dir.exists():
+                print(f"⚠️  Class directory does not exist: {class_dir}")
+                return 0
+
+            # Remove the entire class directory (rmtree is scandir/fd-based on 3.11+)
+            shutil.rmtree(class_dir)
+
+            print(f"✅ Removed {class_name} from {target_info['package']} -> {class_dir}")
+            return 0
+
+        except Exception as e:
+            print(f"❌ Error removing class: {str(e)}")
+            return 1
+
+    def _create_class(self, class_dir, class_name, snake_name, version, target_info, now_iso):
+        """Create class directory and files"""
+        try:
+            # Create class directory
+            class_dir.mkdir(parents=True, exist_ok=True)
+
+            # Create __init__.py (exclusive create: one open instead of stat + open)
+            try:
+                with open(class_dir / "__init__.py", 'x') as f:
+                    f.write(f"# {class_name} module")
+            except FileExistsError:
+                pass
+
+            # Create class file
+            class_result = self._create_class_file(class_dir, class_name, snake_name, version, now_iso)
+            if class_result != 0:
+                return class_result
+
+            # Create registry file
+            registry_result = self._create_registry_file(class_dir, class_name, snake_name, version, target_info, now_iso)
+            if registry_result != 0:
+                return registry_result
+
+            sys.stdout.write(
+                f"✅ Defined {class_name} in {target_info['package']} -> {class_dir}\n"
+                f"📁 Created: {snake_name}_class.py, {snake_name}_registry.yml\n"
+                f"🔢 Version: {version}\n"
+            )
+
+            return 0
+
+        except Exception as e:
+            print(f"❌ Error creating class: {str(e)}")
+            return 1
+
+    def _create_class_file(self, class_dir, class_name, snake_name, version, now_iso):
+        """Create the class file"""
+        try:
+            subs = {
+                "class_name": class_name,
+                "class_name_lower": class_name.lower(),
+                "snake_name": snake_name,
+                "version": version,
+                "created_at": now_iso,
+            }
+            parts = _CLASS_TMPL_PARTS[:]
+            parts[1::2] = [subs[name] for name in _CLASS_TMPL_PARTS[1::2]]
+            class_content = "".join(parts)
+
             # Write class file
             class_file = class_dir / f"{snake_name}_class.py"
             class_file.write_text(class_content)
+            # Byte-compile now so the first import doesn't pay for it
+            py_compile.compile(str(class_file), doraise=False)
 
             return 0
 
@@ -266,17 +329,17 @@ class {class_name}Registry:
             print(f"❌ Error creating class file: {str(e)}")
             return 1
 
-    def _create_registry_file(self, class_dir, class_name, version, target_info):
-        """Create registry YAML file"""
-        try:
-            snake_name = self._to_snake_case(class_name)
+    def _create_registry_file(self, class_dir, class_name, snake_name, version, target_info, now_iso):
+        """Create registry YAML file (written as JSON, which is valid YAML)"""
+        import json
 
+        try:
             registry_data = {
                 "registry_version": version,
                 "registry_type": class_name.lower(),
                 "target": target_info['package'],
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
+                "created_at": now_iso,
+                "updated_at": now_iso,
                 "items": {},
                 "metadata": {
                     "description": f"Registry for {class_name} instances",
@@ -286,8 +349,9 @@ class {class_name}Registry:
             }
 
             registry_file = class_dir / f"{snake_name}_registry.yml"
-            with open(registry_file, 'w') as f:
-                yaml.dump(registry_data, f, default_flow_style=False, sort_keys=False)
+            with open(registry_file, 'w', encoding='utf-8') as f:
+                json.dump(registry_data, f, indent=2, ensure_ascii=False)
+                f.write("\n")
 
             return 0
 
@@ -295,8 +359,8 @@ class {class_name}Registry:
             print(f"❌ Error creating registry file: {str(e)}")
             return 1
 
-    def _to_snake_case(self, name):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _to_snake_case(name):
         """Convert CamelCase to snake_case"""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
\ No newline at end of file
+        return _SNAKE_RE2.sub(r'\1_\2', _SNAKE_RE1.sub(r'\1_\2', name)).lower()
@@ -4,12 +4,21 @@ RegisterSpecVerb - Register resources (domain, cli, verb)
 """
 import sys
 from pathlib import Path
-from dogfold.kernel.target_resolver import TargetResolver
+from dogfold.bootstrap._template_cache import load_template
+from dogfold.kernel.target_resolver import default_resolver
+
+
+def _touch_new(path: Path) -> None:
+  """Create an empty file unless it exists (one open, no separate stat)."""
+  try:
+    path.open('x').close()
+  except FileExistsError:
+    pass
 
 
 class RegisterSpecVerb:
   def __init__(self):
-    self.resolver = TargetResolver()
+    self.resolver = default_resolver()
   
   def execute(self, args):
     if not args:
@@ -56,11 +65,11 @@ class RegisterSpecVerb:
     domain_root = domains_root / name
     classes_dir = domain_root / "classes"
     verbs_dir = domain_root / "verbs"
-    classes_dir.mkdir(parents=True, exist_ok=True)
-    verbs_dir.mkdir(parents=True, exist_ok=True)
-    (domain_root / "__init__.py").write_text("") if not (domain_root / "__init__.py").exists() else None
-    (classes_dir / "__init__.py").write_text("") if not (classes_dir / "__init__.py").exists() else None
-    (verbs_dir / "__init__.py").write_text("") if not (verbs_dir / "__init__.py").exists() else None
+    domain_root.mkdir(parents=True, exist_ok=True)
+    classes_dir.mkdir(exist_ok=True)
+    verbs_dir.mkdir(exist_ok=True)
+    for package_dir in (domain_root, classes_dir, verbs_dir):
+      _touch_new(package_dir / "__init__.py")
     
     # Create commands.py file for Typer integration
     commands_file = domain_root / "commands.py"
@@ -68,7 +77,7 @@ class RegisterSpecVerb:
       templates_root = self.resolver.get_templates_root(target)
       template_file = templates_root / "domain_commands_template.py"
       if template_file.exists():
-        template_content = template_file.read_text()
+        template_content = load_template(template_file)
         commands_content = template_content.replace("{DOMAIN_NAME}", name)
         commands_file.write_text(commands_content)
       else:
@@ -124,7 +133,7 @@ import typer
       return 0
       
     # Copy template to target
-    target_file.write_text(template_file.read_text())
+    target_file.write_text(load_template(template_file))
     print(f"✅ Registered CLI '{cli_name}' in {target_info['package']} -> {target_file}")
     return 0
 